@@ -6,25 +6,31 @@ import os
 import re
 from collections import defaultdict
 
+# Patterns compiled once at module load instead of inside parse_test_output,
+# which may be called with multi-KB test output.
+# Note: pytest version has a hyphen (pytest-X.Y.Z)
+_PLATFORM_RE = re.compile(r'platform (\S+) -- Python ([\d.]+), pytest-([\d.]+)')
+_TIME_RE = re.compile(r'(\d+) passed in ([\d.]+)s')
+_TEST_RE = re.compile(r'tests/test_\w+\.py::(\w+)::\w+ PASSED')
+_SECTION_RE = re.compile(r"## Test Results.*?(?=\n## |\Z)", re.DOTALL)
+
 
 def parse_test_output(test_output):
     """Parse pytest output to extract test summary information."""
-    # Extract platform information - note: pytest version has a hyphen (pytest-X.Y.Z)
-    platform_match = re.search(r'platform (\S+) -- Python ([\d.]+), pytest-([\d.]+)', test_output)
+    # Extract platform information
+    platform_match = _PLATFORM_RE.search(test_output)
     platform = platform_match.group(1) if platform_match else "linux"
     python_version = platform_match.group(2) if platform_match else "3.12.0"
     pytest_version = platform_match.group(3) if platform_match else "9.0.0"
 
     # Extract execution time
-    time_match = re.search(r'(\d+) passed in ([\d.]+)s', test_output)
+    time_match = _TIME_RE.search(test_output)
     total_passed = int(time_match.group(1)) if time_match else 0
     exec_time = time_match.group(2) if time_match else "0"
 
     # Extract test categories and counts
     test_categories = defaultdict(int)
-    test_pattern = r'tests/test_\w+\.py::(\w+)::\w+ PASSED'
-
-    for match in re.finditer(test_pattern, test_output):
+    for match in _TEST_RE.finditer(test_output):
         category = match.group(1)
         test_categories[category] += 1
 
@@ -123,8 +129,7 @@ def main():
     # Check if the test results section already exists
     if "## Test Results" in content:
         # Replace existing test results section (everything from ## Test Results to the next ## or end)
-        pattern = r"## Test Results.*?(?=\n## |\Z)"
-        content = re.sub(pattern, new_section, content, flags=re.DOTALL)
+        content = _SECTION_RE.sub(new_section, content)
     else:
         # Insert before ## License if it exists, otherwise at the end
         if "## License" in content:
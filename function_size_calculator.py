@@ -6,28 +6,57 @@ Outputs results to an Excel (XLSX) file with each repository on a separate tab.
 """
 
 import argparse
+import bisect
+import hashlib
+import heapq
+import itertools
 import json
+import mmap
+import operator
 import os
+import pickle
 import re
 import shutil
+import sqlite3
 import subprocess
 import sys
 import tempfile
-from concurrent.futures import ProcessPoolExecutor, as_completed
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from pathlib import Path
 
 try:
     import openpyxl
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font, PatternFill
 except ImportError:
     print("Error: openpyxl is required. Install it with: pip install openpyxl")
     sys.exit(1)
 
+try:
+    import orjson  # Optional accelerator for JSON output
+except ImportError:
+    orjson = None
+
+
+# Redraw throttle state for print_progress_bar: last draw time and the last
+# integer percentage drawn
+_progress_state = {'time': 0.0, 'percent': -1}
+
+# Minimum interval between progress redraws at an unchanged percentage
+_PROGRESS_REDRAW_INTERVAL = 0.1  # seconds
+
 
 def print_progress_bar(current: int, total: int, prefix: str = '', suffix: str = '', length: int = 50):
     """
     Print a progress bar to the console.
 
+    Redraws are throttled: a draw is skipped when the integer percentage has
+    not changed and the last draw was under _PROGRESS_REDRAW_INTERVAL ago, so
+    repeated updates at the same progress cannot flood the terminal. The
+    final (100%) draw is never skipped.
+
     Args:
         current: Current progress value
         total: Total value for 100% completion
@@ -38,6 +67,15 @@ def print_progress_bar(current: int, total: int, prefix: str = '', suffix: str =
     if total == 0:
         return
 
+    percent_int = 100 * current // total
+    now = time.monotonic()
+    if (current != total
+            and percent_int == _progress_state['percent']
+            and now - _progress_state['time'] < _PROGRESS_REDRAW_INTERVAL):
+        return
+    _progress_state['time'] = now
+    _progress_state['percent'] = percent_int
+
     percent = 100 * (current / float(total))
     filled_length = int(length * current // total)
     bar = '█' * filled_length + '-' * (length - filled_length)
@@ -62,6 +100,10 @@ class FunctionInfo:
         size: Total number of lines in the function
     """
 
+    # Fixed slots instead of a per-instance __dict__: large repositories
+    # create many of these, and they are pickled across process boundaries
+    __slots__ = ('name', 'file_path', 'start_line', 'end_line', 'size')
+
     def __init__(self, name: str, file_path: str, start_line: int, end_line: int, size: int):
         self.name = name
         self.file_path = file_path
@@ -83,28 +125,270 @@ class FunctionInfo:
         }
 
 
+# Regex patterns are compiled once at module import so the hot scanning paths
+# below work with bound re.Pattern objects instead of going through re's
+# internal cache lookup on every call.
+#
+# Both declaration patterns are applied to the whole file content in a single
+# finditer() pass with re.MULTILINE, instead of being re-run on every line.
+# Whitespace inside the patterns is therefore written as [^\S\n] (any
+# whitespace except newline) so a match never spans lines, preserving the
+# line-by-line matching semantics.
+#
+# Patterns are compiled as bytes so they can run directly against a
+# memory-mapped file without decoding the whole content to str; only the
+# captured function names are decoded.
+
+# JavaScript/TypeScript function pattern. The individual declaration forms are
+# merged into a single alternation so each position is scanned once; the named
+# group that matched (match.lastgroup) identifies the declaration kind.
+# The method alternative covers both plain methods and class methods, since
+# the access/static modifier prefix is optional.
+_JS_FUNCTION_RE = re.compile(
+    rb'^[^\S\n]*(?:'
+    # function declaration: function name() {}
+    rb'function[^\S\n]+(?P<function>\w+)[^\S\n]*\('
+    # arrow function: const name = () => {}
+    rb'|(?:const|let|var)[^\S\n]+(?P<arrow>\w+)[^\S\n]*=[^\S\n]*(?:async[^\S\n]*)?\([^)\n]*\)[^\S\n]*=>'
+    # method / class method: async name() {}
+    rb'|(?:public|private|protected|static)?[^\S\n]*(?:async[^\S\n]+)?(?P<method>\w+)[^\S\n]*\([^)\n]*\)[^\S\n]*\{'
+    rb')',
+    re.MULTILINE
+)
+
+# Java method pattern. The whitespace runs and the return-type token use
+# possessive quantifiers (*+/++) so a non-declaration line fails fast instead
+# of backtracking through the optional modifier chain.
+_JAVA_METHOD_RE = re.compile(
+    rb'^[^\S\n]*+(?:public|private|protected)?[^\S\n]*+(?:static)?[^\S\n]*+(?:final)?[^\S\n]*+(?:synchronized)?[^\S\n]*+'
+    rb'[\w<>\[\]]++[^\S\n]+(\w+)[^\S\n]*+\([^)\n]*+\)[^\S\n]*+(?:throws[^\S\n]+[\w, \t]+)?[^\S\n]*+\{',
+    re.MULTILINE
+)
+
+# Heuristics for skipping minified/generated JavaScript: such files are not
+# hand-written code worth reporting, and a multi-megabyte single-line bundle
+# makes every scanning pass degenerate.
+_MAX_JS_FILE_SIZE = 10 * 1024 * 1024  # bytes
+_MINIFIED_LINE_LENGTH = 5000  # a first line this long means minified output
+
+# Matches a single brace; used to locate all braces in a file in one C-level pass.
+_BRACE_RE = re.compile(rb'[{}]')
+
+# Matches string/char literals and comments in JS/TS and Java source. Braces
+# inside these spans are ignored during depth counting so that e.g.
+# console.log("}") or a commented-out block does not corrupt function sizes.
+_LITERAL_RE = re.compile(
+    rb'"(?:\\.|[^"\\\n])*"'      # double-quoted string
+    rb"|'(?:\\.|[^'\\\n])*'"     # single-quoted string / Java char literal
+    rb'|`(?:\\.|[^`\\])*`'       # JS template literal (may span lines)
+    rb'|//[^\n]*'                # line comment
+    rb'|/\*.*?\*/',              # block comment
+    re.DOTALL
+)
+
+
+def _map_file(file_path: str):
+    """
+    Open file_path as a read-only memory map.
+
+    Returns a bytes-like object suitable for the scanning regexes: an mmap
+    for regular files, b'' for empty files (which cannot be mapped), or None
+    when the file cannot be read (a warning is printed).
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b''
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except Exception as e:
+        print(f"Warning: Could not read {file_path}: {e}")
+        return None
+
+
+def _compute_line_starts(content) -> list[int]:
+    """
+    Return the byte offset of the start of each line in content.
+
+    The result is a sorted list suitable for bisect lookups: the 1-indexed
+    line number of byte offset p is bisect_right(line_starts, p).
+    """
+    starts = [0]
+    find = content.find
+    pos = find(b'\n')
+    while pos != -1:
+        starts.append(pos + 1)
+        pos = find(b'\n', pos + 1)
+    return starts
+
+
+def _line_end_depths(content, line_starts: list[int]) -> list[int]:
+    """
+    Return the cumulative brace depth ('{' minus '}') at the end of each line.
+
+    Braces are located with a single finditer pass over the whole content and
+    bucketed into lines, so no per-character Python loop runs. Braces inside
+    string literals and comments are skipped: both would otherwise unbalance
+    the count and drag function ends past (or before) the real closing brace.
+    The running depth is then a cumulative sum computed in C via
+    itertools.accumulate. Checking depth only at line ends matches the
+    original line-based brace counting (a line like '} else {' does not
+    terminate a function).
+    """
+    deltas = [0] * len(line_starts)
+    literals = _LITERAL_RE.finditer(content)
+    literal = next(literals, None)
+    bisect_right = bisect.bisect_right  # Local binding for the hot loop
+
+    for match in _BRACE_RE.finditer(content):
+        pos = match.start()
+        # Advance to the first literal span that could contain this brace
+        while literal is not None and literal.end() <= pos:
+            literal = next(literals, None)
+        if literal is not None and literal.start() <= pos:
+            continue  # Brace is inside a string or comment
+
+        line_index = bisect_right(line_starts, pos) - 1
+        deltas[line_index] += 1 if match.group() == b'{' else -1
+
+    return list(itertools.accumulate(deltas))
+
+
+class FileContext:
+    """
+    Per-file parsing context shared by all extractors of one source file.
+
+    Memory-maps the file once and lazily computes the line-start offset and
+    line-end brace depth tables, so every pass over the same file (declaration
+    scan, brace counting, future extractors) reuses a single buffer and a
+    single brace/literal scan instead of re-reading the content.
+
+    Attributes:
+        file_path: Path of the mapped file
+        content: Bytes-like view of the file, or None if it could not be read
+    """
+
+    __slots__ = ('file_path', 'content', '_line_starts', '_depths')
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.content = _map_file(file_path)
+        self._line_starts = None
+        self._depths = None
+
+    @property
+    def line_starts(self) -> list[int]:
+        """Byte offset of the start of each line, computed on first use."""
+        if self._line_starts is None:
+            self._line_starts = _compute_line_starts(self.content)
+        return self._line_starts
+
+    @property
+    def depths(self) -> list[int]:
+        """Line-end brace depth table, computed on first use."""
+        if self._depths is None:
+            self._depths = _line_end_depths(self.content, self.line_starts)
+        return self._depths
+
+    def close(self):
+        """Release the underlying memory map, if any."""
+        if isinstance(self.content, mmap.mmap):
+            self.content.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _scan_functions(ctx: FileContext, pattern: re.Pattern,
+                    use_lastgroup: bool) -> list[FunctionInfo]:
+    """
+    Find all functions in a file context using a single whole-file regex pass.
+
+    The context content is any bytes-like object (typically an mmap); only
+    the captured function names are decoded to str.
+
+    For each declaration match, the function end is located by walking the
+    context's line-end depth table until the depth returns to its value
+    before the declaration line. Declarations inside an already-tracked
+    function body are skipped, as in the original line-by-line scan.
+
+    Args:
+        ctx: FileContext wrapping the source file
+        pattern: Compiled MULTILINE declaration pattern
+        use_lastgroup: If True, take the name from the named group that
+            matched (JS alternation); otherwise from group 1 (Java)
+
+    Returns:
+        List of FunctionInfo objects for all detected functions
+    """
+    functions = []
+    append = functions.append  # Local bindings for the match loop
+    bisect_right = bisect.bisect_right
+    content = ctx.content
+    file_path = ctx.file_path
+    line_starts = ctx.line_starts
+    depths = ctx.depths
+    total_lines = len(line_starts)
+    last_end = 0  # Last line covered by a recorded multi-line function
+
+    for match in pattern.finditer(content):
+        start_line = bisect_right(line_starts, match.start())  # 1-indexed
+        if start_line <= last_end:
+            # Inside (or on the closing line of) a tracked function
+            continue
+
+        raw_name = match.group(match.lastgroup) if use_lastgroup else match.group(1)
+        func_name = raw_name.decode('utf-8', 'ignore')
+        base_depth = depths[start_line - 2] if start_line >= 2 else 0
+        decl_delta = depths[start_line - 1] - base_depth
+
+        if decl_delta == 0:
+            # Single-line function (rare but possible)
+            append(FunctionInfo(
+                name=func_name,
+                file_path=file_path,
+                start_line=start_line,
+                end_line=start_line,
+                size=1
+            ))
+        elif decl_delta > 0:
+            # Multi-line function - find the line where depth returns to base
+            end_line = None
+            for i in range(start_line, total_lines):
+                if depths[i] == base_depth:
+                    end_line = i + 1
+                    break
+
+            if end_line is None:
+                # Unbalanced braces - function never closes, stop scanning
+                last_end = total_lines
+            else:
+                append(FunctionInfo(
+                    name=func_name,
+                    file_path=file_path,
+                    start_line=start_line,
+                    end_line=end_line,
+                    size=end_line - start_line + 1
+                ))
+                last_end = end_line
+
+    return functions
+
+
 class JavaScriptParser:
     """Parser for JavaScript/TypeScript functions."""
 
-    # Compile regex patterns once for better performance
-    PATTERNS = [
-        # function declaration: function name() {}
-        (re.compile(r'^\s*function\s+(\w+)\s*\('), 'function'),
-        # arrow function: const name = () => {}
-        (re.compile(r'^\s*(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s*)?\([^)]*\)\s*=>'), 'arrow'),
-        # method: name() {}
-        (re.compile(r'^\s*(?:async\s+)?(\w+)\s*\([^)]*\)\s*\{'), 'method'),
-        # class method: async name() {}
-        (re.compile(r'^\s*(?:public|private|protected|static)?\s*(?:async\s+)?(\w+)\s*\([^)]*\)\s*\{'), 'class_method'),
-    ]
+    PATTERN = _JS_FUNCTION_RE
 
     @staticmethod
     def parse_functions(file_path: str) -> list[FunctionInfo]:
         """
         Parse JavaScript/TypeScript file to extract functions.
 
-        Uses a streaming approach to handle very large files efficiently
-        without loading the entire file into memory.
+        Scans a memory map of the file with a single compiled regex pass
+        instead of reading and splitting the content into line strings.
 
         Supports various function patterns including:
         - Function declarations: function name() {}
@@ -118,78 +402,48 @@ class JavaScriptParser:
         Returns:
             List of FunctionInfo objects for all detected functions
         """
-        functions = []
-
-        try:
-            with open(file_path, encoding='utf-8', errors='ignore') as f:
-                line_num = 0
-                current_function = None  # (name, start_line, brace_count)
-
-                for line in f:  # Stream file line by line
-                    line_num += 1
-
-                    # If we're currently tracking a function, update brace count
-                    if current_function:
-                        func_name, start_line, brace_count = current_function
-                        brace_count += line.count('{') - line.count('}')
-
-                        if brace_count == 0:
-                            # Function ended
-                            size = line_num - start_line + 1
-                            functions.append(FunctionInfo(
-                                name=func_name,
-                                file_path=file_path,
-                                start_line=start_line,
-                                end_line=line_num,
-                                size=size
-                            ))
-                            current_function = None
-                        else:
-                            current_function = (func_name, start_line, brace_count)
-                    else:
-                        # Look for new function declarations
-                        for pattern, func_type in JavaScriptParser.PATTERNS:
-                            match = pattern.search(line)
-                            if match:
-                                func_name = match.group(1)
-                                brace_count = line.count('{') - line.count('}')
-
-                                if brace_count == 0:
-                                    # Single-line function (rare but possible)
-                                    functions.append(FunctionInfo(
-                                        name=func_name,
-                                        file_path=file_path,
-                                        start_line=line_num,
-                                        end_line=line_num,
-                                        size=1
-                                    ))
-                                elif brace_count > 0:
-                                    # Multi-line function - start tracking
-                                    current_function = (func_name, line_num, brace_count)
-                                break
-
-        except Exception as e:
-            print(f"Warning: Could not read {file_path}: {e}")
-
-        return functions
+        with FileContext(file_path) as ctx:
+            content = ctx.content
+            if content is None:
+                return []
+
+            # Skip minified or generated bundles: oversized files, or files
+            # whose first line is implausibly long for hand-written code
+            if len(content) > _MAX_JS_FILE_SIZE:
+                return []
+            if (len(content) > _MINIFIED_LINE_LENGTH
+                    and content.find(b'\n', 0, _MINIFIED_LINE_LENGTH) == -1):
+                return []
+            # Honor the conventional @generated marker in the file header
+            if b'@generated' in content[:4096]:
+                return []
+
+            # Cheap literal prefilter: every declaration form needs a '(',
+            # and additionally either the function keyword, an arrow, or a
+            # method body brace. find() runs the real memmem substring
+            # search on an mmap ('needle in mmap' compares byte-by-byte
+            # against its iterator and never matches multi-byte needles),
+            # so files with no functions skip the regex pass entirely.
+            if (content.find(b'(') == -1
+                    or (content.find(b'function') == -1
+                        and content.find(b'=>') == -1
+                        and content.find(b'{') == -1)):
+                return []
+            return _scan_functions(ctx, _JS_FUNCTION_RE, use_lastgroup=True)
 
 
 class JavaParser:
     """Parser for Java functions/methods."""
 
-    # Compile regex pattern once for better performance
-    METHOD_PATTERN = re.compile(
-        r'^\s*(?:public|private|protected)?\s*(?:static)?\s*(?:final)?\s*(?:synchronized)?\s*'
-        r'[\w<>\[\]]+\s+(\w+)\s*\([^)]*\)\s*(?:throws\s+[\w\s,]+)?\s*\{'
-    )
+    METHOD_PATTERN = _JAVA_METHOD_RE
 
     @staticmethod
     def parse_functions(file_path: str) -> list[FunctionInfo]:
         """
         Parse Java file to extract methods.
 
-        Uses a streaming approach to handle very large files efficiently
-        without loading the entire file into memory.
+        Scans a memory map of the file with a single compiled regex pass
+        instead of reading and splitting the content into line strings.
 
         Supports methods with various modifiers including:
         - Access modifiers: public, private, protected
@@ -203,59 +457,29 @@ class JavaParser:
         Returns:
             List of FunctionInfo objects for all detected methods
         """
-        functions = []
-
-        try:
-            with open(file_path, encoding='utf-8', errors='ignore') as f:
-                line_num = 0
-                current_method = None  # (name, start_line, brace_count)
-
-                for line in f:  # Stream file line by line
-                    line_num += 1
-
-                    # If we're currently tracking a method, update brace count
-                    if current_method:
-                        method_name, start_line, brace_count = current_method
-                        brace_count += line.count('{') - line.count('}')
-
-                        if brace_count == 0:
-                            # Method ended
-                            size = line_num - start_line + 1
-                            functions.append(FunctionInfo(
-                                name=method_name,
-                                file_path=file_path,
-                                start_line=start_line,
-                                end_line=line_num,
-                                size=size
-                            ))
-                            current_method = None
-                        else:
-                            current_method = (method_name, start_line, brace_count)
-                    else:
-                        # Look for new method declarations
-                        match = JavaParser.METHOD_PATTERN.search(line)
-                        if match:
-                            method_name = match.group(1)
-                            brace_count = line.count('{') - line.count('}')
-
-                            if brace_count == 0:
-                                # Single-line method (rare but possible)
-                                functions.append(FunctionInfo(
-                                    name=method_name,
-                                    file_path=file_path,
-                                    start_line=line_num,
-                                    end_line=line_num,
-                                    size=1
-                                ))
-                            elif brace_count > 0:
-                                # Multi-line method - start tracking
-                                current_method = (method_name, line_num, brace_count)
-
-        except Exception as e:
-            print(f"Warning: Could not read {file_path}: {e}")
-
-        return functions
-
+        with FileContext(file_path) as ctx:
+            content = ctx.content
+            if content is None:
+                return []
+
+            # Cheap literal prefilter: a method declaration needs both a
+            # parameter list and a body brace, so files without them skip
+            # the regex pass entirely (find() for consistency with the JS
+            # prefilter's mmap-safe substring search).
+            if content.find(b'(') == -1 or content.find(b'{') == -1:
+                return []
+            return _scan_functions(ctx, _JAVA_METHOD_RE, use_lastgroup=False)
+
+
+# Maps file extensions to the parser responsible for them
+_PARSER_DISPATCH = {
+    '.js': JavaScriptParser,
+    '.jsx': JavaScriptParser,
+    '.ts': JavaScriptParser,
+    '.tsx': JavaScriptParser,
+    '.mjs': JavaScriptParser,
+    '.java': JavaParser,
+}
 
 # Constants for test file detection
 _TEST_DIRS = {'test', 'tests', '__tests__', 'spec', 'specs'}
@@ -318,98 +542,353 @@ def is_test_file(file_path: Path) -> bool:
     return False
 
 
-def scan_single_repository(repo_path: str) -> tuple[str, list[FunctionInfo]]:
+class ParseCache:
+    """
+    Persistent content-addressed cache of per-file parse results.
+
+    Entries are keyed by (content digest, parser name), so re-running the
+    tool skips parsing for every unchanged file — including identical
+    vendored copies in other repositories — while any content change makes
+    the old entry unreachable, so stale results are impossible. Only
+    (name, start_line, end_line, size) tuples are stored; the
+    repository-relative path is reattached by the caller.
+    """
+
+    def __init__(self, cache_path: str):
+        cache_dir = os.path.dirname(cache_path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        # One connection shared by the parsing threads of this repository,
+        # guarded by a lock. Autocommit plus WAL keeps writes from the other
+        # worker processes concurrent: with a deferred transaction held open
+        # per repository, the first writer would block every other worker's
+        # puts (and the parse threads waiting on the lock) for the whole scan.
+        self._conn = sqlite3.connect(cache_path, timeout=5,
+                                     check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS parse_cache ('
+            'digest BLOB NOT NULL, '
+            'parser TEXT NOT NULL, '
+            'functions BLOB NOT NULL, '
+            'PRIMARY KEY (digest, parser))'
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def digest_file(file_path: str) -> bytes | None:
+        """Return a 16-byte blake2b digest of the file content, or None on error."""
+        try:
+            with open(file_path, 'rb') as f:
+                return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).digest()
+        except OSError:
+            return None
+
+    def get(self, digest: bytes, parser_name: str) -> list[tuple] | None:
+        """Return cached (name, start_line, end_line, size) tuples, or None on miss."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    'SELECT functions FROM parse_cache WHERE digest = ? AND parser = ?',
+                    (digest, parser_name)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        return pickle.loads(row[0]) if row else None
+
+    def put(self, digest: bytes, parser_name: str, functions: list[FunctionInfo]):
+        """Store parse results for a file; errors are ignored (cache is best-effort)."""
+        payload = pickle.dumps(
+            [(f.name, f.start_line, f.end_line, f.size) for f in functions]
+        )
+        try:
+            with self._lock:
+                self._conn.execute(
+                    'INSERT OR IGNORE INTO parse_cache VALUES (?, ?, ?)',
+                    (digest, parser_name, payload)
+                )
+        except sqlite3.Error:
+            pass
+
+    def close(self):
+        """Close the connection; writes autocommit, and errors are ignored
+        (the cache must never fail a scan)."""
+        with self._lock:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+
+
+def summarize_functions(functions: list[FunctionInfo]) -> dict:
+    """
+    Compute summary statistics for a list of functions in a single pass.
+
+    Args:
+        functions: Functions to summarize
+
+    Returns:
+        A dict with total_functions, average_size, largest_function_size and
+        smallest_function_size keys, or an empty dict for an empty list.
+    """
+    if not functions:
+        return {}
+
+    # One size list feeds the C-implemented builtins, which beat a
+    # Python-level accumulation loop even though they make separate passes
+    sizes = [func.size for func in functions]
+
+    return {
+        'total_functions': len(sizes),
+        'average_size': round(sum(sizes) / len(sizes), 1),
+        'largest_function_size': max(sizes),
+        'smallest_function_size': min(sizes)
+    }
+
+
+# Run git without ever prompting for credentials; a private/missing repo
+# should fail fast instead of hanging a worker on a password prompt
+_GIT_ENV = {**os.environ, 'GIT_TERMINAL_PROMPT': '0'}
+
+
+def _clone_repository(repo_path: str, dest: str) -> bool:
+    """
+    Shallow-clone a remote repository into dest, fetching as little as possible.
+
+    Uses a single-branch, tagless, blob-filtered partial clone plus a
+    sparse checkout of only the extensions the parsers understand, so
+    history, binaries and lockfiles at HEAD are never downloaded. Servers
+    without partial clone support ignore the filter and this degrades to a
+    plain shallow clone.
+
+    Returns:
+        True on success; False (with an error printed) otherwise.
+    """
+    print(f"Cloning repository: {repo_path}")
+    try:
+        subprocess.run(
+            ['git', 'clone', '--depth', '1', '--single-branch', '--no-tags',
+             '--filter=blob:none', '--sparse', repo_path, dest],
+            check=True,
+            capture_output=True,
+            text=True,
+            timeout=300,  # 5 minute timeout for cloning
+            env=_GIT_ENV
+        )
+        subprocess.run(
+            ['git', '-C', dest, 'sparse-checkout', 'set', '--no-cone',
+             '*.js', '*.jsx', '*.ts', '*.tsx', '*.mjs', '*.java'],
+            check=True,
+            capture_output=True,
+            text=True,
+            timeout=300,
+            env=_GIT_ENV
+        )
+        return True
+    except subprocess.TimeoutExpired:
+        print(f"Error: Timeout cloning repository {repo_path} (exceeded 5 minutes)")
+        return False
+    except subprocess.CalledProcessError as e:
+        print(f"Error cloning repository {repo_path}: {e}")
+        return False
+
+
+def _refresh_clone(repo_path: str, dest: str):
+    """
+    Best-effort update of a cached clone to the current remote HEAD.
+
+    On any failure (offline, deleted remote, timeout) a warning is printed
+    and the cached checkout is scanned as-is.
+    """
+    try:
+        subprocess.run(
+            ['git', '-C', dest, 'fetch', '--depth', '1', '--no-tags', 'origin', 'HEAD'],
+            check=True, capture_output=True, text=True, timeout=300, env=_GIT_ENV
+        )
+        subprocess.run(
+            ['git', '-C', dest, 'reset', '--hard', 'FETCH_HEAD'],
+            check=True, capture_output=True, text=True, timeout=300, env=_GIT_ENV
+        )
+    except (subprocess.TimeoutExpired, subprocess.CalledProcessError) as e:
+        print(f"Warning: Could not refresh cached clone of {repo_path}: {e}")
+
+
+def scan_single_repository(repo_path: str, top_n: int | None = None,
+                           min_size: int = 1,
+                           cache_path: str | None = None,
+                           clone_cache_dir: str | None = None,
+                           extra_skip_dirs: tuple[str, ...] = ()) -> tuple[str, list[FunctionInfo], dict]:
     """
     Scan a single repository and return results.
 
     This function is designed to be called in parallel. It handles both remote
     repositories (which are cloned to a temporary directory) and local repositories.
 
+    When top_n is given, only the top_n largest functions (sorted by
+    descending size) are returned alongside summary statistics over the full
+    filtered set, so only a handful of objects cross the process boundary
+    instead of every function in the repository.
+
     Args:
         repo_path: URL of a git repository or path to a local repository
+        top_n: If set, keep only the top_n largest functions
+        min_size: Minimum function size (in lines) to include
+        cache_path: Path to a persistent ParseCache database; files whose
+            content digest is already cached are not re-parsed
+        clone_cache_dir: Directory holding persistent clones keyed by URL
+            hash; re-runs refresh the cached clone with a shallow fetch
+            instead of recloning
+        extra_skip_dirs: Additional directory names to prune during the walk
 
     Returns:
-        A tuple of (repository_name, list_of_functions). Returns (None, []) on error.
+        A tuple of (repository_name, functions, summary). Returns
+        (None, [], {}) on error.
     """
     # Common directories to skip - using sets for O(1) lookup
     SKIP_DIRS = {
         'node_modules', '.git', 'target', 'build', 'out',
-        'dist', 'coverage', '.gradle'
+        'dist', 'coverage', '.gradle', 'vendor', '.next',
+        '.venv', '__pycache__'
     }
+    SKIP_DIRS.update(extra_skip_dirs)
 
     temp_dir = None
     try:
         # Clone or use local repo
         if repo_path.startswith('http://') or repo_path.startswith('https://') or repo_path.startswith('git@'):
             # It's a remote repository - clone it
-            temp_dir = tempfile.mkdtemp(prefix='function_calculator_')
-
-            print(f"Cloning repository: {repo_path}")
-            try:
-                subprocess.run(
-                    ['git', 'clone', '--depth', '1', repo_path, temp_dir],
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=300  # 5 minute timeout for cloning
-                )
+            if clone_cache_dir:
+                # Persistent clone keyed by URL hash: re-runs refresh it with
+                # a shallow fetch instead of re-downloading the repository
+                key = hashlib.sha1(repo_path.encode('utf-8')).hexdigest()[:16]
+                dest = os.path.join(clone_cache_dir, key)
+                if os.path.isdir(os.path.join(dest, '.git')):
+                    _refresh_clone(repo_path, dest)
+                else:
+                    os.makedirs(clone_cache_dir, exist_ok=True)
+                    if not _clone_repository(repo_path, dest):
+                        # Do not leave a half-populated entry behind
+                        shutil.rmtree(dest, ignore_errors=True)
+                        return None, [], {}
+                local_path = dest
+            else:
+                temp_dir = tempfile.mkdtemp(prefix='function_calculator_')
+                if not _clone_repository(repo_path, temp_dir):
+                    return None, [], {}
                 local_path = temp_dir
-            except subprocess.TimeoutExpired:
-                print(f"Error: Timeout cloning repository {repo_path} (exceeded 5 minutes)")
-                return None, []
-            except subprocess.CalledProcessError as e:
-                print(f"Error cloning repository {repo_path}: {e}")
-                return None, []
         else:
             # It's a local path
             if os.path.exists(repo_path):
                 local_path = repo_path
             else:
                 print(f"Error: Local path does not exist: {repo_path}")
-                return None, []
-
-        all_functions = []
+                return None, [], {}
+
+        # Collect candidate files in a single walk, then parse them in
+        # parallel. Skipped directories are pruned at traversal time so their
+        # subtrees are never visited, instead of filtering per file after
+        # separate rglob passes per extension.
+        candidates = []
+        for root, dirs, files in os.walk(local_path):
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+            for name in files:
+                # Skip pre-minified artifacts by name
+                if name.endswith(('.min.js', '.min.mjs')):
+                    continue
 
-        # Find all JavaScript/TypeScript files
-        js_extensions = ['.js', '.jsx', '.ts', '.tsx', '.mjs']
-        for ext in js_extensions:
-            for file_path in Path(local_path).rglob(f'*{ext}'):
-                # Skip common directories using set lookup
-                if any(part in SKIP_DIRS for part in file_path.parts):
+                parser = _PARSER_DISPATCH.get(os.path.splitext(name)[1])
+                if parser is None:
                     continue
 
+                # Join with os.path so the candidate keeps the walk root
+                # verbatim; Path() would normalize '.' segments and doubled
+                # separators away and break the prefix strip below
+                file_path = os.path.join(root, name)
+
                 # Skip test files
-                if is_test_file(file_path):
+                if is_test_file(Path(file_path)):
                     continue
 
-                functions = JavaScriptParser.parse_functions(str(file_path))
-                # Make paths relative to repo root
-                for func in functions:
-                    func.file_path = os.path.relpath(func.file_path, local_path)
-                all_functions.extend(functions)
+                candidates.append((file_path, parser))
 
-        # Find all Java files
-        for file_path in Path(local_path).rglob('*.java'):
-            # Skip common build directories using set lookup
-            if any(part in SKIP_DIRS for part in file_path.parts):
-                continue
+        # Every scanned path starts with the repo root, so the relative path
+        # is a constant-prefix strip rather than an os.path.relpath call
+        # (which normalizes and splits both paths) per function
+        prefix_len = len(os.path.join(local_path, ''))
 
-            # Skip test files
-            if is_test_file(file_path):
-                continue
-
-            functions = JavaParser.parse_functions(str(file_path))
+        cache = None
+        if cache_path:
+            try:
+                cache = ParseCache(cache_path)
+            except (OSError, sqlite3.Error) as e:
+                print(f"Warning: Could not open parse cache {cache_path}: {e}")
+
+        # In-memory memo for identical files within this repository (vendored
+        # copies, generated duplicates); worst case a race re-parses a file
+        memo = {}
+
+        def parse_file(candidate):
+            path, parser = candidate
+            rel_path = path[prefix_len:]  # Computed once per file
+
+            digest = None
+            memo_key = None
+            if cache is not None:
+                digest = ParseCache.digest_file(path)
+                if digest is not None:
+                    memo_key = (digest, parser.__name__)
+                    cached = memo.get(memo_key)
+                    if cached is None:
+                        cached = cache.get(digest, parser.__name__)
+                        if cached is not None:
+                            memo[memo_key] = cached
+                    if cached is not None:
+                        return [FunctionInfo(name, rel_path, start, end, size)
+                                for name, start, end, size in cached]
+
+            functions = parser.parse_functions(path)
             # Make paths relative to repo root
             for func in functions:
-                func.file_path = os.path.relpath(func.file_path, local_path)
-            all_functions.extend(functions)
+                func.file_path = rel_path
+
+            if memo_key is not None:
+                memo[memo_key] = [(f.name, f.start_line, f.end_line, f.size)
+                                  for f in functions]
+                cache.put(digest, parser.__name__, functions)
+            return functions
+
+        # Parse files in parallel; threads overlap file I/O while the regex
+        # scans run at C level, adding a second axis of parallelism on top of
+        # the per-repository process pool.
+        all_functions = []
+        try:
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+                for functions in pool.map(parse_file, candidates):
+                    all_functions.extend(functions)
+        finally:
+            if cache is not None:
+                cache.close()
 
         # Get repository name
         repo_name = os.path.basename(repo_path.rstrip('/').replace('.git', ''))
         if not repo_name:
             repo_name = 'repository'
 
-        return repo_name, all_functions
+        # Filter and summarize in the worker so the caller receives a small,
+        # ready-to-report payload instead of every function in the repository
+        if min_size > 1:
+            filtered_functions = [f for f in all_functions if f.size >= min_size]
+        else:
+            filtered_functions = all_functions
+        summary = summarize_functions(filtered_functions)
+
+        if top_n is not None:
+            functions = heapq.nlargest(top_n, filtered_functions, key=operator.attrgetter('size'))
+        else:
+            functions = filtered_functions
+
+        return repo_name, functions, summary
 
     finally:
         # Cleanup temporary directory
@@ -417,30 +896,56 @@ def scan_single_repository(repo_path: str) -> tuple[str, list[FunctionInfo]]:
             shutil.rmtree(temp_dir)
 
 
+def _rank_results(repo_results: dict[str, list[FunctionInfo]],
+                  top_n: int, min_size: int) -> dict[str, tuple[list[FunctionInfo], list[FunctionInfo]]]:
+    """
+    Filter by min_size and select the top_n largest functions per repository.
+
+    Shared by both writers so the filter/selection logic lives in one place;
+    returns {repo_name: (filtered_functions, top_functions)}.
+    """
+    ranked = {}
+    for repo_name, functions in repo_results.items():
+        filtered = [f for f in functions if f.size >= min_size]
+        ranked[repo_name] = (
+            filtered,
+            heapq.nlargest(top_n, filtered, key=operator.attrgetter('size'))
+        )
+    return ranked
+
+
 class ExcelWriter:
     """Writes results to Excel (XLSX) file."""
 
+    # Shared styling, built once instead of per sheet
+    _HEADER_FILL = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+    _HEADER_FONT = Font(bold=True, color='FFFFFF')
+    _COLUMN_WIDTHS = (('A', 8), ('B', 30), ('C', 50), ('D', 12), ('E', 12), ('F', 15))
+    _HEADERS = ('Rank', 'Function Name', 'File Path', 'Start Line', 'End Line', 'Lines of Code')
+
     @staticmethod
     def write_results(repo_results: dict[str, list[FunctionInfo]], output_file: str,
-                     top_n: int = 5, min_size: int = 1):
+                     top_n: int = 5, min_size: int = 1,
+                     summaries: dict[str, dict] | None = None):
         """
         Write results to Excel (XLSX) file with each repo on a separate tab.
 
         Args:
             repo_results: Dictionary mapping repository names to lists of functions
-            output_file: Path to the output Excel file
+            output_file: Path to the output Excel file, or a binary file-like
+                object (e.g. io.BytesIO) to write without touching disk
             top_n: Number of top functions to include per repository
             min_size: Minimum function size (in lines) to include
+            summaries: Optional precomputed per-repository summary statistics
+                (as produced by scan_single_repository); computed from the
+                given functions when absent
         """
-        wb = openpyxl.Workbook()
-        # Remove default sheet
-        if 'Sheet' in wb.sheetnames:
-            wb.remove(wb['Sheet'])
-
-        for repo_name, functions in repo_results.items():
-            # Filter by minimum size
-            filtered_functions = [f for f in functions if f.size >= min_size]
+        # Write-only mode streams rows straight to XML instead of keeping
+        # every cell in memory until save()
+        wb = openpyxl.Workbook(write_only=True)
 
+        for repo_name, (filtered_functions, top_functions) in _rank_results(
+                repo_results, top_n, min_size).items():
             # Create sanitized sheet name (Excel has 31 char limit and special char restrictions)
             sheet_name = repo_name.replace('/', '_').replace('\\', '_')
             if len(sheet_name) > 31:
@@ -448,19 +953,19 @@ class ExcelWriter:
 
             ws = wb.create_sheet(title=sheet_name)
 
-            # Add header row
-            headers = ['Rank', 'Function Name', 'File Path', 'Start Line', 'End Line', 'Lines of Code']
-            ws.append(headers)
-
-            # Style header
-            header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
-            header_font = Font(bold=True, color='FFFFFF')
-            for cell in ws[1]:
-                cell.fill = header_fill
-                cell.font = header_font
+            # Column widths must be set before rows are appended in
+            # write-only mode
+            for column, width in ExcelWriter._COLUMN_WIDTHS:
+                ws.column_dimensions[column].width = width
 
-            # Sort functions by size (descending) and take top N
-            top_functions = sorted(filtered_functions, key=lambda f: f.size, reverse=True)[:top_n]
+            # Add styled header row; write-only sheets take pre-styled cells
+            header_row = []
+            for header in ExcelWriter._HEADERS:
+                cell = WriteOnlyCell(ws, value=header)
+                cell.fill = ExcelWriter._HEADER_FILL
+                cell.font = ExcelWriter._HEADER_FONT
+                header_row.append(cell)
+            ws.append(header_row)
 
             # Add data rows
             for rank, func in enumerate(top_functions, 1):
@@ -474,37 +979,22 @@ class ExcelWriter:
                 ])
 
             # Add summary statistics at the bottom
-            # Calculate in a single pass for efficiency
-            if filtered_functions:
-                total = len(filtered_functions)
-                total_size = 0
-                smallest_size = float('inf')
-                largest_size = 0
-
-                for func in filtered_functions:
-                    total_size += func.size
-                    if func.size < smallest_size:
-                        smallest_size = func.size
-                    if func.size > largest_size:
-                        largest_size = func.size
-
+            summary = (summaries or {}).get(repo_name)
+            if summary is None:
+                summary = summarize_functions(filtered_functions)
+            if summary:
                 ws.append([])  # Empty row
                 ws.append(['Summary Statistics'])
-                ws.append(['Total Functions Found:', total])
-                ws.append(['Average Function Size:', f"{total_size / total:.1f} lines"])
-                ws.append(['Largest Function:', largest_size])
-                ws.append(['Smallest Function:', smallest_size])
-
-            # Adjust column widths
-            ws.column_dimensions['A'].width = 8
-            ws.column_dimensions['B'].width = 30
-            ws.column_dimensions['C'].width = 50
-            ws.column_dimensions['D'].width = 12
-            ws.column_dimensions['E'].width = 12
-            ws.column_dimensions['F'].width = 15
+                ws.append(['Total Functions Found:', summary['total_functions']])
+                ws.append(['Average Function Size:', f"{summary['average_size']:.1f} lines"])
+                ws.append(['Largest Function:', summary['largest_function_size']])
+                ws.append(['Smallest Function:', summary['smallest_function_size']])
 
         wb.save(output_file)
-        print(f"\nResults saved to: {output_file}")
+        if hasattr(output_file, 'write'):
+            print("\nResults written")
+        else:
+            print(f"\nResults saved to: {output_file}")
 
 
 class JSONWriter:
@@ -512,56 +1002,48 @@ class JSONWriter:
 
     @staticmethod
     def write_results(repo_results: dict[str, list[FunctionInfo]], output_file: str,
-                     top_n: int = 5, min_size: int = 1):
+                     top_n: int = 5, min_size: int = 1,
+                     summaries: dict[str, dict] | None = None):
         """
         Write results to JSON file.
 
         Args:
             repo_results: Dictionary mapping repository names to lists of functions
-            output_file: Path to the output JSON file
+            output_file: Path to the output JSON file, or a binary file-like
+                object (e.g. io.BytesIO) to write without touching disk
             top_n: Number of top functions to include per repository
             min_size: Minimum function size (in lines) to include
+            summaries: Optional precomputed per-repository summary statistics
+                (as produced by scan_single_repository); computed from the
+                given functions when absent
         """
         output_data = {}
 
-        for repo_name, functions in repo_results.items():
-            # Filter by minimum size
-            filtered_functions = [f for f in functions if f.size >= min_size]
-
-            # Sort functions by size (descending) and take top N
-            top_functions = sorted(filtered_functions, key=lambda f: f.size, reverse=True)[:top_n]
-
-            # Calculate summary statistics in a single pass
-            summary = {}
-            if filtered_functions:
-                total = len(filtered_functions)
-                total_size = 0
-                smallest_size = float('inf')
-                largest_size = 0
-
-                for func in filtered_functions:
-                    total_size += func.size
-                    if func.size < smallest_size:
-                        smallest_size = func.size
-                    if func.size > largest_size:
-                        largest_size = func.size
-
-                summary = {
-                    'total_functions': total,
-                    'average_size': round(total_size / total, 1),
-                    'largest_function_size': largest_size,
-                    'smallest_function_size': smallest_size
-                }
+        for repo_name, (filtered_functions, top_functions) in _rank_results(
+                repo_results, top_n, min_size).items():
+            summary = (summaries or {}).get(repo_name)
+            if summary is None:
+                summary = summarize_functions(filtered_functions)
 
             output_data[repo_name] = {
                 'summary': summary,
                 'top_functions': [f.to_dict() for f in top_functions]
             }
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        # orjson serializes in one native pass when available; the stdlib
+        # json module produces equivalent output otherwise
+        if orjson is not None:
+            payload = orjson.dumps(output_data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(output_data, indent=2, ensure_ascii=False).encode('utf-8')
 
-        print(f"\nResults saved to: {output_file}")
+        if hasattr(output_file, 'write'):
+            output_file.write(payload)
+            print("\nResults written")
+        else:
+            with open(output_file, 'wb') as f:
+                f.write(payload)
+            print(f"\nResults saved to: {output_file}")
 
 
 def main():
@@ -607,6 +1089,18 @@ def main():
         default=1,
         help='Minimum function size in lines to include (default: 1)'
     )
+    parser.add_argument(
+        '--exclude',
+        action='append',
+        default=[],
+        metavar='DIR',
+        help='Additional directory name to skip while scanning (repeatable)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Disable the persistent parse and clone caches (~/.cache/function_size_calculator, override with FSC_CACHE)'
+    )
 
     args = parser.parse_args()
 
@@ -644,16 +1138,20 @@ def main():
         print("Error: Output file must have .json extension when using json format")
         sys.exit(1)
 
-    # Collect repositories from command line and/or input file
-    repositories = list(args.repositories) if args.repositories else []
+    # Collect repositories from command line and/or input file, dropping
+    # duplicates while preserving order - a duplicate entry would clone and
+    # scan the same repository twice
+    repositories = list(dict.fromkeys(args.repositories)) if args.repositories else []
+    seen = set(repositories)
 
     if args.input_file:
         try:
             with open(args.input_file, encoding='utf-8') as f:
                 for line in f:
                     line = line.strip()
-                    # Skip empty lines and comments
-                    if line and not line.startswith('#'):
+                    # Skip empty lines, comments and duplicates
+                    if line and not line.startswith('#') and line not in seen:
+                        seen.add(line)
                         repositories.append(line)
         except FileNotFoundError:
             print(f"Error: Input file not found: {args.input_file}")
@@ -671,69 +1169,88 @@ def main():
     print(f"Configuration: Top {args.top_n} functions, Minimum size: {args.min_size} lines")
     print(f"{'='*60}\n")
 
+    cache_path = None
+    clone_cache_dir = None
+    if not args.no_cache:
+        cache_root = os.environ.get('FSC_CACHE') or os.path.join(
+            os.path.expanduser('~'), '.cache', 'function_size_calculator')
+        cache_path = os.path.join(cache_root, 'parse_cache.sqlite')
+        clone_cache_dir = os.path.join(cache_root, 'clones')
+
     repo_results = {}
+    repo_summaries = {}
     completed_count = 0
     total_repos = len(repositories)
 
     # Show initial progress bar
     print_progress_bar(0, total_repos, prefix='Progress:', suffix='Complete')
 
-    # Process repositories in parallel
+    # Process repositories in parallel. Tasks are submitted in a bounded
+    # sliding window (2 x jobs in flight) instead of all upfront, so memory
+    # stays constant regardless of how many repositories are listed and
+    # Ctrl-C does not have to cancel a full queue.
+    repo_iter = iter(repositories)
     with ProcessPoolExecutor(max_workers=args.jobs) as executor:
-        # Submit all tasks
-        future_to_repo = {executor.submit(scan_single_repository, repo): repo for repo in repositories}
-
-        # Process completed tasks
-        for future in as_completed(future_to_repo):
-            repo = future_to_repo[future]
-            try:
-                repo_name, functions = future.result()
-
-                if repo_name is not None:
-                    repo_results[repo_name] = functions
-                    completed_count += 1
-
-                    # Update progress bar
-                    print_progress_bar(completed_count, total_repos,
-                                     prefix='Progress:',
-                                     suffix=f'Complete ({completed_count}/{total_repos})')
-
-                    # Filter by minimum size for display
-                    filtered = [f for f in functions if f.size >= args.min_size]
-
-                    # Print summary for this repository
-                    top_n_display = sorted(filtered, key=lambda f: f.size, reverse=True)[:args.top_n]
-                    print(f"\n✓ Repository: {repo}")
-                    print(f"  Found {len(functions)} functions ({len(filtered)} >= {args.min_size} lines). Top {args.top_n} largest:")
-                    for i, func in enumerate(top_n_display, 1):
-                        print(f"    {i}. {func.name} ({func.size} lines) - {func.file_path}")
-
-                    # Print progress bar again after summary (if not last repo)
-                    if completed_count < total_repos:
-                        print()  # Empty line before progress bar
+        inflight = {}
+
+        def submit_next():
+            repo = next(repo_iter, None)
+            if repo is not None:
+                inflight[executor.submit(scan_single_repository, repo, args.top_n,
+                                         args.min_size, cache_path, clone_cache_dir,
+                                         tuple(args.exclude))] = repo
+
+        for _ in range(2 * args.jobs):
+            submit_next()
+
+        # Process completed tasks, refilling the window after each one
+        while inflight:
+            done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+            for future in done:
+                repo = inflight.pop(future)
+                submit_next()
+                try:
+                    repo_name, functions, summary = future.result()
+
+                    if repo_name is not None:
+                        repo_results[repo_name] = functions
+                        repo_summaries[repo_name] = summary
+                        completed_count += 1
+
+                        # Update progress bar
                         print_progress_bar(completed_count, total_repos,
                                          prefix='Progress:',
                                          suffix=f'Complete ({completed_count}/{total_repos})')
-            except Exception as e:
-                completed_count += 1
-                print_progress_bar(completed_count, total_repos,
-                                 prefix='Progress:',
-                                 suffix=f'Complete ({completed_count}/{total_repos})')
-                print(f"\n✗ Error processing repository {repo}: {e}")
-                if completed_count < total_repos:
-                    print()
+
+                        # Print summary for this repository in a single write;
+                        # functions are already filtered and sorted by descending
+                        # size in the worker
+                        lines = [
+                            f"\n✓ Repository: {repo}",
+                            f"  Found {summary.get('total_functions', 0)} functions >= {args.min_size} lines. Top {args.top_n} largest:",
+                        ]
+                        lines.extend(
+                            f"    {i}. {func.name} ({func.size} lines) - {func.file_path}"
+                            for i, func in enumerate(functions, 1)
+                        )
+                        print('\n'.join(lines))
+                except Exception as e:
+                    completed_count += 1
                     print_progress_bar(completed_count, total_repos,
                                      prefix='Progress:',
                                      suffix=f'Complete ({completed_count}/{total_repos})')
+                    print(f"\n✗ Error processing repository {repo}: {e}")
 
 
     # Write results to file
     print()  # Add blank line after progress bar
     if repo_results:
         if output_format == 'json':
-            JSONWriter.write_results(repo_results, args.output, args.top_n, args.min_size)
+            JSONWriter.write_results(repo_results, args.output, args.top_n, args.min_size,
+                                     summaries=repo_summaries)
         else:
-            ExcelWriter.write_results(repo_results, args.output, args.top_n, args.min_size)
+            ExcelWriter.write_results(repo_results, args.output, args.top_n, args.min_size,
+                                      summaries=repo_summaries)
         print(f"\n{'='*60}")
         print(f"✓ Done! Check {args.output} for detailed results.")
         print(f"{'='*60}")
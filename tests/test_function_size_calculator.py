@@ -5,7 +5,7 @@ import json
 import os
 import sys
 from contextlib import redirect_stderr, redirect_stdout
-from io import StringIO
+from io import BytesIO
 from pathlib import Path
 
 import pytest
@@ -29,13 +29,57 @@ try:
 except ImportError:  # pragma: no cover - dependency is optional in CI
     openpyxl = None
 
+# Shared sink for silencing writer/scanner output: one devnull handle for the
+# whole run instead of a fresh StringIO buffer per redirected call.
+_DEVNULL = open(os.devnull, "w")  # noqa: SIM115
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def fixtures_dir() -> Path:
-    """Return path to test fixtures."""
+    """Return path to test fixtures, computed once per session."""
     return Path(__file__).parent / "fixtures"
 
 
+# Fixture files are immutable, so each is parsed once per module and the
+# resulting lists are shared by every test that only reads them.
+
+@pytest.fixture(scope="module")
+def writer_output_dir(tmp_path_factory) -> Path:
+    """Shared output directory for the writer tests (one mkdir per module);
+    each test writes to a file named after itself."""
+    return tmp_path_factory.mktemp("writer_outputs")
+
+
+@pytest.fixture(scope="module")
+def js_functions(fixtures_dir: Path) -> list:
+    """Functions parsed from the sample.js fixture, computed once."""
+    return JavaScriptParser.parse_functions(str(fixtures_dir / "sample.js"))
+
+
+@pytest.fixture(scope="module")
+def ts_functions(fixtures_dir: Path) -> list:
+    """Functions parsed from the sample.ts fixture, computed once."""
+    return JavaScriptParser.parse_functions(str(fixtures_dir / "sample.ts"))
+
+
+@pytest.fixture(scope="module")
+def java_functions(fixtures_dir: Path) -> list:
+    """Methods parsed from the Sample.java fixture, computed once."""
+    return JavaParser.parse_functions(str(fixtures_dir / "Sample.java"))
+
+
+# Shared writer-test inputs, built once at import; the writers never mutate
+# the FunctionInfo objects, so sharing them across tests is safe.
+_SAMPLE_FUNCTIONS = (
+    FunctionInfo("func1", "file1.js", 1, 10, 10),
+    FunctionInfo("func2", "file2.js", 1, 20, 20),
+    FunctionInfo("func3", "file3.js", 1, 15, 15),
+    FunctionInfo("func4", "file4.js", 1, 5, 5),
+    FunctionInfo("func5", "file5.js", 1, 8, 8),
+    FunctionInfo("func6", "file6.js", 1, 12, 12),
+)
+
+
 class TestFunctionInfo:
     """Tests for FunctionInfo class."""
 
@@ -76,33 +120,28 @@ class TestFunctionInfo:
 class TestJavaScriptParser:
     """Tests for JavaScriptParser."""
 
-    @pytest.fixture(autouse=True)
-    def _setup(self, fixtures_dir: Path):
-        self.js_file = fixtures_dir / "sample.js"
-        self.ts_file = fixtures_dir / "sample.ts"
-
-    def test_parse_javascript_file(self):
-        functions = JavaScriptParser.parse_functions(str(self.js_file))
+    def test_parse_javascript_file(self, js_functions: list):
+        functions = js_functions
 
         assert len(functions) > 0
 
-        func_names = [f.name for f in functions]
+        func_names = frozenset(f.name for f in functions)
         assert "simpleFunction" in func_names
         assert "largeFunction" in func_names
         assert "arrowFunction" in func_names
         assert "asyncArrowFunction" in func_names
         assert "outerFunction" in func_names
 
-    def test_parse_typescript_file(self):
-        functions = JavaScriptParser.parse_functions(str(self.ts_file))
+    def test_parse_typescript_file(self, ts_functions: list):
+        functions = ts_functions
 
         assert len(functions) > 0
 
-        func_names = [f.name for f in functions]
+        func_names = frozenset(f.name for f in functions)
         assert "typedFunction" in func_names
 
-    def test_function_size_calculation(self):
-        functions = JavaScriptParser.parse_functions(str(self.js_file))
+    def test_function_size_calculation(self, js_functions: list):
+        functions = js_functions
 
         simple = next((f for f in functions if f.name == "simpleFunction"), None)
         assert simple is not None
@@ -113,15 +152,50 @@ class TestJavaScriptParser:
         assert large.size > simple.size
 
     def test_parse_nonexistent_file(self):
-        with redirect_stdout(StringIO()), redirect_stderr(StringIO()):
+        with redirect_stdout(_DEVNULL), redirect_stderr(_DEVNULL):
             functions = JavaScriptParser.parse_functions("/nonexistent/file.js")
 
         assert len(functions) == 0
 
-    def test_function_line_numbers(self):
-        functions = JavaScriptParser.parse_functions(str(self.js_file))
+    def test_braces_in_strings_and_comments(self, tmp_path: Path):
+        """Braces inside literals and comments should not affect function size."""
+        source = (
+            'function tricky() {\n'
+            '    console.log("}");\n'
+            "    const c = '{';\n"
+            '    // } stray comment brace\n'
+            '    /* { */\n'
+            '    return c;\n'
+            '}\n'
+        )
+        js_file = tmp_path / "tricky.js"
+        js_file.write_text(source)
+
+        functions = JavaScriptParser.parse_functions(str(js_file))
+
+        tricky = next((f for f in functions if f.name == "tricky"), None)
+        assert tricky is not None
+        assert tricky.start_line == 1
+        assert tricky.end_line == 7
+        assert tricky.size == 7
+
+    def test_braceless_arrow_only_file(self, tmp_path: Path):
+        """A file containing only brace-less arrow functions is still parsed."""
+        source = (
+            'const add = (a, b) => a + b;\n'
+            'const identity = (x) => x;\n'
+        )
+        js_file = tmp_path / "arrows.js"
+        js_file.write_text(source)
 
-        for func in functions:
+        functions = JavaScriptParser.parse_functions(str(js_file))
+
+        func_names = frozenset(f.name for f in functions)
+        assert func_names == {"add", "identity"}
+        assert all(f.size == 1 for f in functions)
+
+    def test_function_line_numbers(self, js_functions: list):
+        for func in js_functions:
             assert func.start_line > 0
             assert func.end_line >= func.start_line
             assert func.size > 0
@@ -130,38 +204,31 @@ class TestJavaScriptParser:
 class TestJavaParser:
     """Tests for JavaParser."""
 
-    @pytest.fixture(autouse=True)
-    def _setup(self, fixtures_dir: Path):
-        self.java_file = fixtures_dir / "Sample.java"
-
-    def test_parse_java_file(self):
-        functions = JavaParser.parse_functions(str(self.java_file))
+    def test_parse_java_file(self, java_functions: list):
+        functions = java_functions
 
         assert len(functions) > 0
 
-        func_names = [f.name for f in functions]
+        func_names = frozenset(f.name for f in functions)
         assert "publicMethod" in func_names
         assert "privateMethod" in func_names
         assert "protectedStaticMethod" in func_names
         assert "largeMethod" in func_names
 
-    def test_java_method_modifiers(self):
-        functions = JavaParser.parse_functions(str(self.java_file))
-        func_names = [f.name for f in functions]
+    def test_java_method_modifiers(self, java_functions: list):
+        func_names = frozenset(f.name for f in java_functions)
 
         assert "publicStaticFinalMethod" in func_names
         assert "synchronizedMethod" in func_names
         assert "methodWithException" in func_names
 
-    def test_java_function_size(self):
-        functions = JavaParser.parse_functions(str(self.java_file))
-
-        large = next((f for f in functions if f.name == "largeMethod"), None)
+    def test_java_function_size(self, java_functions: list):
+        large = next((f for f in java_functions if f.name == "largeMethod"), None)
         assert large is not None
         assert large.size >= 10
 
     def test_parse_nonexistent_java_file(self):
-        with redirect_stdout(StringIO()), redirect_stderr(StringIO()):
+        with redirect_stdout(_DEVNULL), redirect_stderr(_DEVNULL):
             functions = JavaParser.parse_functions("/nonexistent/Sample.java")
 
         assert len(functions) == 0
@@ -171,39 +238,47 @@ class TestExcelWriter:
     """Tests for ExcelWriter."""
 
     @pytest.fixture(autouse=True)
-    def _setup(self, tmp_path: Path):
-        self.output_file = tmp_path / "test_output.xlsx"
-        self.sample_functions = [
-            FunctionInfo("func1", "file1.js", 1, 10, 10),
-            FunctionInfo("func2", "file2.js", 1, 20, 20),
-            FunctionInfo("func3", "file3.js", 1, 15, 15),
-            FunctionInfo("func4", "file4.js", 1, 5, 5),
-            FunctionInfo("func5", "file5.js", 1, 8, 8),
-            FunctionInfo("func6", "file6.js", 1, 12, 12),
-        ]
+    def _setup(self, writer_output_dir: Path, request):
+        self.output_file = writer_output_dir / f"{request.node.name}.xlsx"
+        self.sample_functions = list(_SAMPLE_FUNCTIONS)
 
     @pytest.mark.skipif(openpyxl is None, reason="openpyxl not available")
     def test_write_results_single_repo(self):
         repo_results = {"test-repo": self.sample_functions}
 
-        with redirect_stdout(StringIO()):
+        with redirect_stdout(_DEVNULL):
             ExcelWriter.write_results(repo_results, str(self.output_file))
 
         assert self.output_file.exists()
 
-        wb = openpyxl.load_workbook(self.output_file)
+        wb = openpyxl.load_workbook(self.output_file, read_only=True, data_only=True)
         assert "test-repo" in wb.sheetnames
 
         ws = wb["test-repo"]
-        assert ws.cell(1, 1).value == "Rank"
-        assert ws.cell(1, 2).value == "Function Name"
-        assert ws.cell(1, 6).value == "Lines of Code"
+        rows = list(ws.iter_rows(max_row=6, values_only=True))
+        assert rows[0][0] == "Rank"
+        assert rows[0][1] == "Function Name"
+        assert rows[0][5] == "Lines of Code"
+
+        assert rows[1][0] == 1
+        assert rows[1][1] == "func2"
+        assert rows[1][5] == 20
+
+        assert rows[5][0] == 5
+        wb.close()
 
-        assert ws.cell(2, 1).value == 1
-        assert ws.cell(2, 2).value == "func2"
-        assert ws.cell(2, 6).value == 20
+    @pytest.mark.skipif(openpyxl is None, reason="openpyxl not available")
+    def test_write_results_to_buffer(self):
+        """Writing to a file-like object should not touch disk."""
+        repo_results = {"test-repo": self.sample_functions}
+        buffer = BytesIO()
 
-        assert ws.cell(6, 1).value == 5
+        with redirect_stdout(_DEVNULL):
+            ExcelWriter.write_results(repo_results, buffer)
+
+        buffer.seek(0)
+        wb = openpyxl.load_workbook(buffer, read_only=True, data_only=True)
+        assert "test-repo" in wb.sheetnames
         wb.close()
 
     @pytest.mark.skipif(openpyxl is None, reason="openpyxl not available")
@@ -213,12 +288,12 @@ class TestExcelWriter:
             "repo2": self.sample_functions[3:],
         }
 
-        with redirect_stdout(StringIO()):
+        with redirect_stdout(_DEVNULL):
             ExcelWriter.write_results(repo_results, str(self.output_file))
 
         assert self.output_file.exists()
 
-        wb = openpyxl.load_workbook(self.output_file)
+        wb = openpyxl.load_workbook(self.output_file, read_only=True, data_only=True)
         assert "repo1" in wb.sheetnames
         assert "repo2" in wb.sheetnames
         wb.close()
@@ -229,10 +304,10 @@ class TestExcelWriter:
             "very/long/repository/name/that/exceeds/thirty/one/characters": self.sample_functions[:1]
         }
 
-        with redirect_stdout(StringIO()):
+        with redirect_stdout(_DEVNULL):
             ExcelWriter.write_results(repo_results, str(self.output_file))
 
-        wb = openpyxl.load_workbook(self.output_file)
+        wb = openpyxl.load_workbook(self.output_file, read_only=True, data_only=True)
         sheet_names = wb.sheetnames
         assert len(sheet_names) == 1
         assert len(sheet_names[0]) <= 31
@@ -243,17 +318,16 @@ class TestExcelWriter:
     def test_top_n_parameter(self):
         repo_results = {"test-repo": self.sample_functions}
 
-        with redirect_stdout(StringIO()):
+        with redirect_stdout(_DEVNULL):
             ExcelWriter.write_results(repo_results, str(self.output_file), top_n=3)
 
-        wb = openpyxl.load_workbook(self.output_file)
+        wb = openpyxl.load_workbook(self.output_file, read_only=True, data_only=True)
         ws = wb["test-repo"]
 
-        data_rows = 0
-        for row in range(2, 10):
-            value = ws.cell(row, 1).value
-            if value and isinstance(value, int):
-                data_rows += 1
+        data_rows = sum(
+            1 for row in ws.iter_rows(min_row=2, max_row=9, max_col=1, values_only=True)
+            if row[0] and isinstance(row[0], int)
+        )
 
         assert data_rows == 3
         wb.close()
@@ -262,22 +336,20 @@ class TestExcelWriter:
     def test_min_size_filter(self):
         repo_results = {"test-repo": self.sample_functions}
 
-        with redirect_stdout(StringIO()):
+        with redirect_stdout(_DEVNULL):
             ExcelWriter.write_results(repo_results, str(self.output_file), top_n=10, min_size=10)
 
-        wb = openpyxl.load_workbook(self.output_file)
+        wb = openpyxl.load_workbook(self.output_file, read_only=True, data_only=True)
         ws = wb["test-repo"]
+        # Read-only mode yields ragged tuples (the blank spacer row is empty)
+        rows = list(ws.iter_rows(min_row=2, max_row=9, values_only=True))
 
-        data_rows = 0
-        for row in range(2, 10):
-            value = ws.cell(row, 1).value
-            if value and isinstance(value, int):
-                data_rows += 1
+        data_rows = sum(1 for row in rows if row and isinstance(row[0], int))
 
         assert data_rows == 4
 
-        for row in range(2, 6):
-            size = ws.cell(row, 6).value
+        for row in rows[:4]:
+            size = row[5]
             if size is not None and isinstance(size, int):
                 assert size >= 10
 
@@ -287,13 +359,16 @@ class TestExcelWriter:
     def test_summary_statistics(self):
         repo_results = {"test-repo": self.sample_functions}
 
-        with redirect_stdout(StringIO()):
+        with redirect_stdout(_DEVNULL):
             ExcelWriter.write_results(repo_results, str(self.output_file))
 
-        wb = openpyxl.load_workbook(self.output_file)
+        wb = openpyxl.load_workbook(self.output_file, read_only=True, data_only=True)
         ws = wb["test-repo"]
 
-        found_summary = any(ws.cell(row, 1).value == "Summary Statistics" for row in range(1, 20))
+        found_summary = any(
+            row and row[0] == "Summary Statistics"
+            for row in ws.iter_rows(max_col=1, max_row=20, values_only=True)
+        )
         assert found_summary, "Summary statistics section not found"
         wb.close()
 
@@ -302,20 +377,14 @@ class TestJSONWriter:
     """Tests for JSONWriter."""
 
     @pytest.fixture(autouse=True)
-    def _setup(self, tmp_path: Path):
-        self.output_file = tmp_path / "test_output.json"
-        self.sample_functions = [
-            FunctionInfo("func1", "file1.js", 1, 10, 10),
-            FunctionInfo("func2", "file2.js", 1, 20, 20),
-            FunctionInfo("func3", "file3.js", 1, 15, 15),
-            FunctionInfo("func4", "file4.js", 1, 5, 5),
-            FunctionInfo("func5", "file5.js", 1, 8, 8),
-        ]
+    def _setup(self, writer_output_dir: Path, request):
+        self.output_file = writer_output_dir / f"{request.node.name}.json"
+        self.sample_functions = list(_SAMPLE_FUNCTIONS[:5])
 
     def test_write_results_single_repo(self):
         repo_results = {"test-repo": self.sample_functions}
 
-        with redirect_stdout(StringIO()):
+        with redirect_stdout(_DEVNULL):
             JSONWriter.write_results(repo_results, str(self.output_file))
 
         assert self.output_file.exists()
@@ -337,13 +406,24 @@ class TestJSONWriter:
         assert top_funcs[0]["name"] == "func2"
         assert top_funcs[0]["size"] == 20
 
+    def test_write_results_to_buffer(self):
+        """Writing to a file-like object should not touch disk."""
+        repo_results = {"test-repo": self.sample_functions}
+        buffer = BytesIO()
+
+        with redirect_stdout(_DEVNULL):
+            JSONWriter.write_results(repo_results, buffer)
+
+        data = json.loads(buffer.getvalue())
+        assert "test-repo" in data
+
     def test_write_results_multiple_repos(self):
         repo_results = {
             "repo1": self.sample_functions[:3],
             "repo2": self.sample_functions[3:],
         }
 
-        with redirect_stdout(StringIO()):
+        with redirect_stdout(_DEVNULL):
             JSONWriter.write_results(repo_results, str(self.output_file))
 
         assert self.output_file.exists()
@@ -355,7 +435,7 @@ class TestJSONWriter:
     def test_top_n_parameter(self):
         repo_results = {"test-repo": self.sample_functions}
 
-        with redirect_stdout(StringIO()):
+        with redirect_stdout(_DEVNULL):
             JSONWriter.write_results(repo_results, str(self.output_file), top_n=3)
 
         data = json.loads(self.output_file.read_text())
@@ -365,7 +445,7 @@ class TestJSONWriter:
     def test_min_size_filter(self):
         repo_results = {"test-repo": self.sample_functions}
 
-        with redirect_stdout(StringIO()):
+        with redirect_stdout(_DEVNULL):
             JSONWriter.write_results(repo_results, str(self.output_file), top_n=10, min_size=10)
 
         data = json.loads(self.output_file.read_text())
@@ -387,7 +467,7 @@ class TestJSONWriter:
 
         repo_results = {"repo1": repo1_functions, "repo2": repo2_functions}
 
-        with redirect_stdout(StringIO()):
+        with redirect_stdout(_DEVNULL):
             JSONWriter.write_results(repo_results, str(self.output_file), top_n=10, min_size=2)
 
         data = json.loads(self.output_file.read_text())
@@ -428,29 +508,78 @@ class TestScanRepository:
     """Tests for scan_single_repository function."""
 
     def test_scan_local_repository(self, test_repository: Path):
-        repo_name, functions = scan_single_repository(str(test_repository))
+        repo_name, functions, summary = scan_single_repository(str(test_repository))
 
         assert repo_name is not None
         assert len(functions) > 0
+        assert summary["total_functions"] == len(functions)
 
-        func_names = [f.name for f in functions]
+        func_names = frozenset(f.name for f in functions)
         assert "testFunc" in func_names
         assert "testMethod" in func_names
 
     def test_scan_nonexistent_repository(self):
-        with redirect_stdout(StringIO()), redirect_stderr(StringIO()):
-            repo_name, functions = scan_single_repository("/nonexistent/repo")
+        with redirect_stdout(_DEVNULL), redirect_stderr(_DEVNULL):
+            repo_name, functions, summary = scan_single_repository("/nonexistent/repo")
 
         assert repo_name is None
         assert len(functions) == 0
+        assert summary == {}
+
+    def test_scan_with_top_n(self, test_repository: Path):
+        repo_name, functions, summary = scan_single_repository(str(test_repository), top_n=1)
+
+        assert repo_name is not None
+        assert len(functions) == 1
+        # Summary still covers the full filtered set, not just the returned top
+        assert summary["total_functions"] == 2
 
     def test_relative_paths(self, test_repository: Path):
-        _, functions = scan_single_repository(str(test_repository))
+        _, functions, _ = scan_single_repository(str(test_repository))
 
         for func in functions:
             assert not func.file_path.startswith("/")
             assert not func.file_path.startswith(str(test_repository))
 
+    def test_relative_paths_with_unnormalized_roots(self, test_repository: Path, monkeypatch):
+        """Dot-relative and doubled-separator roots should yield clean relative paths."""
+        expected = sorted([os.path.join("src", "Sample.java"), os.path.join("src", "test.js")])
+
+        monkeypatch.chdir(test_repository)
+        _, functions, _ = scan_single_repository(".")
+        assert sorted(f.file_path for f in functions) == expected
+
+        doubled = str(test_repository.parent) + os.sep + os.sep + test_repository.name
+        _, functions, _ = scan_single_repository(doubled)
+        assert sorted(f.file_path for f in functions) == expected
+
+
+class TestParseCache:
+    """Tests for the persistent parse cache."""
+
+    def test_cache_round_trip(self, test_repository: Path, tmp_path: Path):
+        """A cached rescan should return identical results."""
+        cache_path = str(tmp_path / "parse_cache.sqlite")
+
+        name1, funcs1, summary1 = scan_single_repository(str(test_repository),
+                                                         cache_path=cache_path)
+        assert Path(cache_path).exists()
+
+        name2, funcs2, summary2 = scan_single_repository(str(test_repository),
+                                                         cache_path=cache_path)
+
+        assert name2 == name1
+        assert summary2 == summary1
+        assert [f.to_dict() for f in funcs2] == [f.to_dict() for f in funcs1]
+
+    def test_cache_disabled_by_default(self, test_repository: Path, tmp_path: Path):
+        """Without a cache path no cache file should be created."""
+        cache_path = tmp_path / "parse_cache.sqlite"
+
+        scan_single_repository(str(test_repository))
+
+        assert not cache_path.exists()
+
 
 class TestCommandLineArguments:
     """Tests for command-line argument handling."""
@@ -464,12 +593,12 @@ class TestCommandLineArguments:
             "/path/to/local/repo\n"
         )
 
-        repositories = []
-        with open(input_file, encoding="utf-8") as file_handle:
-            for line in file_handle:
-                line = line.strip()
-                if line and not line.startswith("#"):
-                    repositories.append(line)
+        lines = input_file.read_text(encoding="utf-8").splitlines()
+        repositories = [
+            stripped
+            for stripped in (line.strip() for line in lines)
+            if stripped and not stripped.startswith("#")
+        ]
 
         assert len(repositories) == 2
         assert "https://github.com/user/repo1.git" in repositories
@@ -506,8 +635,8 @@ class TestEmptyResults:
     """Tests for handling empty results scenarios."""
 
     @pytest.fixture(autouse=True)
-    def _setup(self, tmp_path: Path):
-        self.output_file = tmp_path / "test_output"
+    def _setup(self, writer_output_dir: Path, request):
+        self.output_file = writer_output_dir / request.node.name
 
     @pytest.mark.skipif(openpyxl is None, reason="openpyxl not available")
     def test_write_empty_repo_excel(self):
@@ -515,14 +644,15 @@ class TestEmptyResults:
         repo_results = {"empty-repo": []}
         output_file = str(self.output_file) + ".xlsx"
 
-        with redirect_stdout(StringIO()):
+        with redirect_stdout(_DEVNULL):
             ExcelWriter.write_results(repo_results, output_file)
 
         assert Path(output_file).exists()
-        wb = openpyxl.load_workbook(output_file)
+        wb = openpyxl.load_workbook(output_file, read_only=True, data_only=True)
         ws = wb["empty-repo"]
         # Should still have header
-        assert ws.cell(1, 1).value == "Rank"
+        first_row = next(ws.iter_rows(max_row=1, values_only=True))
+        assert first_row[0] == "Rank"
         wb.close()
 
     def test_write_empty_repo_json(self):
@@ -530,7 +660,7 @@ class TestEmptyResults:
         repo_results = {"empty-repo": []}
         output_file = str(self.output_file) + ".json"
 
-        with redirect_stdout(StringIO()):
+        with redirect_stdout(_DEVNULL):
             JSONWriter.write_results(repo_results, output_file)
 
         assert Path(output_file).exists()
@@ -642,7 +772,7 @@ public class CalculatorTest {
         (src_dir / "UtilsTest.java").write_text(test_content)
 
         # Scan the repository
-        repo_name, functions = scan_single_repository(str(repo_dir))
+        repo_name, functions, _ = scan_single_repository(str(repo_dir))
 
         # Should find functions from Calculator.java but not from test files
         assert repo_name is not None
@@ -687,7 +817,7 @@ const testMultiply = () => {
         (src_dir / "utils.spec.js").write_text(test_content)
 
         # Scan the repository
-        repo_name, functions = scan_single_repository(str(repo_dir))
+        repo_name, functions, _ = scan_single_repository(str(repo_dir))
 
         # Should find functions from utils.js but not from test files
         assert repo_name is not None
@@ -716,7 +846,7 @@ const testMultiply = () => {
         (test_dir / "Helper.java").write_text("public class Helper { public void help() {} }")
 
         # Scan the repository
-        repo_name, functions = scan_single_repository(str(repo_dir))
+        repo_name, functions, _ = scan_single_repository(str(repo_dir))
 
         assert repo_name is not None
         func_files = [f.file_path for f in functions]